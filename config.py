@@ -7,10 +7,15 @@ IMPORTANTE: En producción, usar variables de entorno o un gestor de secretos.
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
+def _env_flag(name: str, default: str = "false") -> bool:
+    """Lee una variable de entorno booleana ("1"/"true"/"yes")"""
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
 @dataclass
 class MySQLConfig:
     """Configuración de conexión a MySQL"""
@@ -20,19 +25,35 @@ class MySQLConfig:
     password: str = "etl_password_2024"
     database: str = "etl_ventas"
     charset: str = "utf8mb4"
+    # False = extensión C (libmysqlclient), más rápida; MYSQL_USE_PURE=true
+    # fuerza el conector en Python puro si la extensión no está disponible
+    use_pure: bool = field(default_factory=lambda: _env_flag("MYSQL_USE_PURE"))
+    pool_name: str = "etl"
+    pool_size: int = 8  # Conexiones reutilizables en el pool
     
-    def get_connection_dict(self) -> dict:
-        """Retorna diccionario de conexión para mysql.connector"""
-        return {
+    def get_connection_dict(self, local_infile_dir: Optional[str] = None) -> dict:
+        """
+        Retorna diccionario de conexión para mysql.connector.
+        
+        Args:
+            local_infile_dir: Si se indica, habilita LOAD DATA LOCAL INFILE
+                solo para archivos dentro de ese directorio
+        """
+        config = {
             "host": self.host,
             "port": self.port,
             "user": self.user,
             "password": self.password,
             "database": self.database,
             "charset": self.charset,
-            "use_pure": True,  # Usar implementación Python pura
+            "use_pure": self.use_pure,  # Extensión C salvo que se fuerce Python puro
             "autocommit": False  # Control manual de transacciones
         }
+        
+        if local_infile_dir:
+            config["allow_local_infile_in_path"] = local_infile_dir
+        
+        return config
     
     def get_connection_string(self) -> str:
         """Retorna string de conexión (para SQLAlchemy si se necesita)"""
@@ -51,8 +72,22 @@ class ETLConfig:
     csv_filename: str = "ventas_raw.csv"
     log_filename: str = "etl.log"
     
+    # Nivel del logger (variable ETL_LOG_LEVEL); con DEBUG se registra
+    # además el progreso por batch y el desglose de nulls
+    log_level: str = field(
+        default_factory=lambda: os.getenv("ETL_LOG_LEVEL", "INFO").upper()
+    )
+    
     # Parámetros del ETL
     batch_size: int = 1000  # Registros por batch en la carga
+    use_load_data: bool = True  # LOAD DATA LOCAL INFILE (False = INSERT por batches)
+    transform_engine: str = "pandas"  # "pandas" o "polars" (requiere polars y pyarrow)
+    disable_binlog: bool = False  # sql_log_bin = 0 en la carga (sin réplica; requiere privilegios)
+    
+    # Pipeline en streaming: chunks del CSV a través de colas acotadas
+    streaming: bool = True
+    chunk_size: int = 50_000  # Registros por chunk leído del CSV
+    queue_size: int = 4  # Chunks en espera entre etapas (contrapresión)
     
     @property
     def csv_path(self) -> str:
@@ -110,6 +145,10 @@ def load_from_env() -> MySQLConfig:
     - MYSQL_USER
     - MYSQL_PASSWORD
     - MYSQL_DATABASE
+    
+    Variables opcionales:
+    - MYSQL_USE_PURE: "1"/"true" fuerza el conector en Python puro
+      (fallback si la extensión C no está disponible)
     """
     from dotenv import load_dotenv
     load_dotenv()
@@ -130,11 +169,15 @@ if __name__ == "__main__":
     print(f"Port: {mysql_config.port}")
     print(f"User: {mysql_config.user}")
     print(f"Database: {mysql_config.database}")
+    print(f"Use Pure: {mysql_config.use_pure}")
+    print(f"Pool: {mysql_config.pool_name} ({mysql_config.pool_size} conexiones)")
     print(f"\nConnection String: {mysql_config.get_connection_string()}")
     
     print("\n=== Configuración ETL ===")
     print(f"CSV Path: {etl_config.csv_path}")
     print(f"Batch Size: {etl_config.batch_size}")
+    print(f"Log Level: {etl_config.log_level}")
+    print(f"Streaming: {etl_config.streaming} (chunk size: {etl_config.chunk_size})")
     
     print("\n=== Configuración Datos Sintéticos ===")
     print(f"Número de registros: {synthetic_config.num_records}")
@@ -13,18 +13,24 @@ Autor: Proyecto educativo de Data Engineering
 
 import os
 import sys
-import uuid
+import secrets
+import tempfile
+import queue
 import logging
+import threading
+from logging.handlers import MemoryHandler
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Iterator
 from contextlib import contextmanager
 
 import pandas as pd
 import numpy as np
-import mysql.connector
 from mysql.connector import Error as MySQLError
+from mysql.connector import __version_info__ as MYSQL_CONNECTOR_VERSION
+from mysql.connector.pooling import MySQLConnectionPool
 
-from config import mysql_config, etl_config
+from config import MySQLConfig, mysql_config, etl_config
 
 
 # ============================================================
@@ -39,7 +45,7 @@ def setup_logging() -> logging.Logger:
     
     # Configurar logger
     logger = logging.getLogger('ETL_Pipeline')
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(etl_config.log_level)
     
     # Formato de log
     formatter = logging.Formatter(
@@ -60,8 +66,17 @@ def setup_logging() -> logging.Logger:
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
     
+    # Buffer en memoria para el archivo: escribe en bloques de 512
+    # registros (o de inmediato ante un ERROR) en lugar de uno por uno
+    buffered_handler = MemoryHandler(
+        capacity=512,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    buffered_handler.setLevel(logging.DEBUG)
+    
     # Añadir handlers
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_handler)
     logger.addHandler(console_handler)
     
     return logger
@@ -75,13 +90,46 @@ logger = setup_logging()
 # CONEXIÓN A MYSQL
 # ============================================================
 
+# Pool de conexiones compartido (se crea en el primer uso)
+_connection_pool: Optional[MySQLConnectionPool] = None
+
+
+def get_connection_pool(config: MySQLConfig) -> MySQLConnectionPool:
+    """
+    Retorna el pool de conexiones, creándolo la primera vez.
+    
+    Se crea de forma perezosa para que importar el módulo no abra
+    conexiones contra el servidor. Nombre, tamaño y parámetros de
+    conexión salen del mismo MySQLConfig.
+    """
+    global _connection_pool
+    
+    if _connection_pool is None:
+        # LOAD DATA LOCAL solo se permite sobre el directorio temporal,
+        # y solo si la carga lo usa
+        local_infile_dir = tempfile.gettempdir() if etl_config.use_load_data else None
+        
+        logger.info(
+            f"Creando pool de conexiones '{config.pool_name}' "
+            f"({config.pool_size} conexiones)"
+        )
+        _connection_pool = MySQLConnectionPool(
+            pool_name=config.pool_name,
+            pool_size=config.pool_size,
+            **config.get_connection_dict(local_infile_dir=local_infile_dir)
+        )
+    
+    return _connection_pool
+
+
 class MySQLConnection:
     """
     Gestor de conexiones a MySQL con context manager.
-    Implementa el patrón de conexión segura.
+    Implementa el patrón de conexión segura sobre un pool:
+    connect() toma una conexión del pool y disconnect() la devuelve.
     """
     
-    def __init__(self, config: dict):
+    def __init__(self, config: MySQLConfig):
         self.config = config
         self.connection = None
         self.cursor = None
@@ -89,9 +137,9 @@ class MySQLConnection:
     def connect(self) -> bool:
         """Establece conexión a MySQL"""
         try:
-            logger.info(f"Conectando a MySQL: {self.config['host']}:{self.config['port']}")
+            logger.info(f"Conectando a MySQL: {self.config.host}:{self.config.port}")
             
-            self.connection = mysql.connector.connect(**self.config)
+            self.connection = get_connection_pool(self.config).get_connection()
             
             if self.connection.is_connected():
                 db_info = self.connection.get_server_info()
@@ -111,13 +159,14 @@ class MySQLConnection:
             return False
     
     def disconnect(self):
-        """Cierra la conexión de forma segura"""
+        """Devuelve la conexión al pool de forma segura"""
         try:
             if self.cursor:
                 self.cursor.close()
-            if self.connection and self.connection.is_connected():
+            if self.connection:
+                # En una conexión del pool, close() la devuelve al pool
                 self.connection.close()
-                logger.info("Conexión a MySQL cerrada")
+                logger.info("Conexión a MySQL devuelta al pool")
         except MySQLError as e:
             logger.warning(f"Error al cerrar conexión: {e}")
     
@@ -130,6 +179,40 @@ class MySQLConnection:
             logger.error(f"Error ejecutando query: {e}")
             raise
     
+    def execute_multi(self, script: str) -> int:
+        """
+        Ejecuta un script de varias sentencias en un solo round-trip.
+        
+        Consume los result sets intermedios (p.ej. SELECT de estado)
+        para dejar la conexión lista para la siguiente query.
+        
+        Returns:
+            Número de sentencias ejecutadas
+        """
+        try:
+            # Connector/Python < 9.2: execute(multi=True) devuelve un
+            # iterador de resultados; desde 9.2 execute() acepta varias
+            # sentencias y los resultados se recorren con nextset()
+            if MYSQL_CONNECTOR_VERSION < (9, 2):
+                executed = 0
+                for result in self.cursor.execute(script, multi=True):
+                    if result.with_rows:
+                        result.fetchall()
+                    executed += 1
+                return executed
+            
+            self.cursor.execute(script)
+            executed = 1
+            while True:
+                if self.cursor.with_rows:
+                    self.cursor.fetchall()
+                if not self.cursor.nextset():
+                    return executed
+                executed += 1
+        except MySQLError as e:
+            logger.error(f"Error ejecutando script: {e}")
+            raise
+    
     def executemany(self, query: str, data: List[tuple]) -> int:
         """Ejecuta query para múltiples registros"""
         try:
@@ -150,8 +233,8 @@ class MySQLConnection:
 
 @contextmanager
 def get_mysql_connection():
-    """Context manager para conexiones MySQL"""
-    conn = MySQLConnection(mysql_config.get_connection_dict())
+    """Context manager que toma y devuelve una conexión del pool"""
+    conn = MySQLConnection(mysql_config)
     try:
         if not conn.connect():
             raise ConnectionError("No se pudo conectar a MySQL")
@@ -164,6 +247,18 @@ def get_mysql_connection():
 # FASE EXTRACT
 # ============================================================
 
+# Tipos del CSV de ventas: categorías para columnas de baja cardinalidad.
+# Las columnas numéricas no se tipan aquí: un valor malformado ('abc',
+# '$12') debe llegar a TRANSFORM, que lo convierte y rechaza la fila.
+# fecha tampoco: read_csv infiere el formato de la primera fila, y
+# fix_dates aplica siempre ISO y luego dd/mm/yyyy fila por fila
+CSV_DTYPES = {
+    'producto': 'category',
+    'categoria': 'category',
+    'region': 'category'
+}
+
+
 def extract(filepath: str) -> pd.DataFrame:
     """
     EXTRACT: Lee datos del archivo CSV
@@ -183,11 +278,11 @@ def extract(filepath: str) -> pd.DataFrame:
     
     logger.info(f"Leyendo archivo: {filepath}")
     
-    # Leer CSV con configuración adecuada
+    # Leer CSV con tipos explícitos (evita la inferencia y reduce memoria)
     df = pd.read_csv(
         filepath,
         encoding='utf-8',
-        low_memory=False
+        dtype=CSV_DTYPES
     )
     
     # Información del dataset
@@ -210,13 +305,119 @@ def extract(filepath: str) -> pd.DataFrame:
 # FASE TRANSFORM
 # ============================================================
 
+def build_rejected_records(rejected_df: pd.DataFrame) -> List[dict]:
+    """
+    Construye los registros de auditoría para filas rechazadas.
+    
+    Las razones se calculan con máscaras vectorizadas por columna y
+    todas las filas se serializan a JSON en una sola pasada.
+    
+    Args:
+        rejected_df: DataFrame con las filas que no pasaron la validación
+        
+    Returns:
+        Lista de dicts con 'raw_data' y 'rejection_reason'
+    """
+    if rejected_df.empty:
+        return []
+    
+    # Razones de rechazo calculadas por columna (vectorizado)
+    reasons = np.full(len(rejected_df), '', dtype=object)
+    checks = [
+        (rejected_df['fecha'].isna(), 'fecha_nula'),
+        (rejected_df['cantidad'].isna() | (rejected_df['cantidad'] <= 0),
+         'cantidad_invalida'),
+        (rejected_df['precio_unitario'].isna() | (rejected_df['precio_unitario'] <= 0),
+         'precio_invalido'),
+        (rejected_df['producto'].isna() | (rejected_df['producto'] == ''),
+         'producto_vacio'),
+        (rejected_df['categoria'].isna() | (rejected_df['categoria'] == ''),
+         'categoria_vacia'),
+        (rejected_df['region'].isna() | (rejected_df['region'] == ''),
+         'region_vacia'),
+    ]
+    for condition, tag in checks:
+        condition = condition.to_numpy(dtype=bool, na_value=False)
+        reasons = np.where(
+            condition,
+            np.where(reasons == '', tag, reasons + ', ' + tag),
+            reasons
+        )
+    
+    # to_json interpreta mal fechas con resolución distinta de ns (p.ej.
+    # datetime64[ms] desde Polars): se normalizan antes de serializar
+    datetime_columns = {
+        col: 'datetime64[ns]'
+        for col, dtype in rejected_df.dtypes.items()
+        if pd.api.types.is_datetime64_dtype(dtype)
+    }
+    if datetime_columns:
+        rejected_df = rejected_df.astype(datetime_columns)
+    
+    # Serializar todos los registros en una sola pasada
+    raw_data = rejected_df.to_json(orient='records', lines=True).split('\n')
+    return [
+        {'raw_data': raw, 'rejection_reason': reason}
+        for raw, reason in zip(raw_data, reasons)
+    ]
+
+
+class SeenKeys:
+    """
+    Hashes uint64 de clave de duplicado vistos en chunks anteriores.
+    
+    Se guardan en un array NumPy ordenado: la pertenencia se resuelve con
+    searchsorted sobre el chunk completo, sin bucles ni objetos Python.
+    """
+    
+    def __init__(self):
+        self.keys = np.empty(0, dtype=np.uint64)
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def filter_new(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Marca las claves no vistas y las incorpora al conjunto.
+        
+        Args:
+            keys: Hashes uint64 del chunk (sin repetidos entre sí)
+            
+        Returns:
+            Máscara booleana: True para las claves nuevas
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        positions = np.searchsorted(self.keys, keys)
+        positions[positions == len(self.keys)] = 0
+        is_new = (
+            self.keys[positions] != keys if len(self.keys)
+            else np.ones(len(keys), dtype=bool)
+        )
+        self.keys = np.union1d(self.keys, keys[is_new])
+        return is_new
+
+
 class DataTransformer:
     """
     Clase para aplicar transformaciones y limpieza de datos.
     """
     
-    def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
+    # Columnas de texto con pocos valores distintos (se limpian por categoría)
+    CATEGORICAL_COLUMNS = ('producto', 'categoria', 'region')
+    
+    # Columnas de texto NOT NULL en la tabla ventas
+    REQUIRED_TEXT_COLUMNS = ('producto', 'categoria', 'region')
+    
+    def __init__(self, df: pd.DataFrame, seen_keys: Optional[SeenKeys] = None):
+        """
+        Args:
+            df: DataFrame con datos raw. El transformer toma posesión del
+                DataFrame y lo modifica en sitio (no se copia)
+            seen_keys: Hashes de clave de duplicado vistos en chunks anteriores
+                (pipeline en streaming); se actualiza en remove_duplicates
+        """
+        self.df = df
+        self.seen_keys = seen_keys
         self.rejected_records = []
         self.stats = {
             'original_count': len(df),
@@ -233,40 +434,76 @@ class DataTransformer:
         
         for col in string_columns:
             if col in self.df.columns:
-                # Remover espacios extra
-                original_values = self.df[col].copy()
-                self.df[col] = self.df[col].astype(str).str.strip()
+                if col in self.CATEGORICAL_COLUMNS:
+                    self._clean_categorical(col)
+                    continue
                 
-                # Estandarizar capitalización
-                if col == 'region':
-                    self.df[col] = self.df[col].str.title()
+                # Remover espacios extra; los nulos se conservan para que
+                # handle_nulls los rellene (astype(str) los volvía 'nan')
+                values = self.df[col]
+                cleaned = values.where(values.isna(), values.astype(str)).str.strip()
                 
-                # Contar cambios
-                changed = (original_values != self.df[col]).sum()
+                # Contar cambios antes de reemplazar (sin copiar la columna)
+                changed = (self.df[col] != cleaned).sum()
+                self.df[col] = cleaned
                 self.stats['strings_cleaned'] += changed
         
         logger.info(f"   Strings limpiados: {self.stats['strings_cleaned']}")
         return self
     
+    def _clean_categorical(self, col: str):
+        """
+        Limpia una columna de baja cardinalidad sobre sus categorías.
+        
+        strip/title se aplican una vez por valor distinto y luego se
+        remapean los códigos; las categorías que quedan iguales tras
+        limpiar (p.ej. 'LIMA SUR' y 'Lima Sur') se fusionan.
+        """
+        values = self.df[col].astype('category')
+        categories = values.cat.categories.astype(str)
+        codes = values.cat.codes.to_numpy()
+        
+        # Remover espacios extra
+        cleaned = categories.str.strip()
+        
+        # Estandarizar capitalización
+        if col == 'region':
+            cleaned = cleaned.str.title()
+        
+        # El código -1 (nulo) indexa el último elemento añadido: sigue nulo
+        new_categories = cleaned.unique()
+        category_map = np.append(new_categories.get_indexer(cleaned), -1)
+        new_codes = category_map[codes]
+        
+        self.df[col] = pd.Categorical.from_codes(new_codes, categories=new_categories)
+        
+        # Contar cambios (los nulos cuentan como cambio, igual que con astype(str))
+        category_changed = np.append(np.asarray(categories != cleaned), True)
+        changed = category_changed[codes].sum()
+        self.stats['strings_cleaned'] += int(changed)
+    
     def fix_dates(self) -> 'DataTransformer':
         """Convierte y valida fechas"""
         
-        # Intentar convertir a datetime
-        def parse_date(x):
-            if pd.isna(x):
-                return pd.NaT
-            try:
-                # Intentar formato ISO primero
-                return pd.to_datetime(x)
-            except:
-                try:
-                    # Intentar formato dd/mm/yyyy
-                    return pd.to_datetime(x, format='%d/%m/%Y')
-                except:
-                    return pd.NaT
-        
-        original_nulls = self.df['fecha'].isna().sum()
-        self.df['fecha'] = self.df['fecha'].apply(parse_date)
+        # Las fechas ya vienen tipadas si read_csv pudo parsearlas
+        if pd.api.types.is_datetime64_any_dtype(self.df['fecha']):
+            logger.info("   Fechas ya convertidas en EXTRACT")
+            return self
+        
+        fechas = self.df['fecha']
+        original_nulls = fechas.isna().sum()
+        
+        # Formato ISO primero (vectorizado, sin inferir por fila)
+        parsed = pd.to_datetime(fechas, format='ISO8601', errors='coerce')
+        
+        # Reintentar formato dd/mm/yyyy solo en las filas no convertidas
+        mask = parsed.isna() & fechas.notna()
+        if mask.any():
+            parsed.loc[mask] = pd.to_datetime(
+                fechas[mask], format='%d/%m/%Y', errors='coerce'
+            )
+        
+        self.df['fecha'] = parsed
         new_nulls = self.df['fecha'].isna().sum()
         
         self.stats['dates_fixed'] = new_nulls - original_nulls
@@ -300,17 +537,27 @@ class DataTransformer:
     def handle_nulls(self) -> 'DataTransformer':
         """Maneja valores nulos"""
         
-        # Contar nulls por columna
-        null_counts = self.df.isnull().sum()
-        total_nulls = null_counts.sum()
+        # Nulls por columna con count(): una columna a la vez, sin la
+        # máscara N×K de isnull() sobre todo el DataFrame
+        null_counts = {
+            col: len(self.df) - self.df[col].count()
+            for col in self.df.columns
+        }
+        total_nulls = int(sum(null_counts.values()))
         
         logger.debug("   Nulls por columna:")
-        for col, count in null_counts[null_counts > 0].items():
-            logger.debug(f"      {col}: {count}")
+        for col, count in null_counts.items():
+            if count > 0:
+                logger.debug(f"      {col}: {count}")
         
-        # Rellenar nulls en campos opcionales
-        self.df['vendedor'] = self.df['vendedor'].fillna('Sin asignar')
-        self.df['cliente_id'] = self.df['cliente_id'].fillna('CLI-00000')
+        # Rellenar nulls en campos opcionales, solo si los hay
+        fill_values = {
+            col: value
+            for col, value in {'vendedor': 'Sin asignar', 'cliente_id': 'CLI-00000'}.items()
+            if null_counts.get(col)
+        }
+        if fill_values:
+            self.df.fillna(fill_values, inplace=True)
         
         self.stats['nulls_fixed'] = total_nulls
         logger.info(f"   Valores nulos tratados: {self.stats['nulls_fixed']}")
@@ -328,7 +575,20 @@ class DataTransformer:
             'precio_unitario', 'cliente_id'
         ]
         
-        self.df = self.df.drop_duplicates(subset=dup_columns, keep='first')
+        # Proyectar la clave a un hash uint64 por fila: se compara un
+        # entero en lugar de una tupla de 5 columnas (se conserva la primera)
+        # (numéricos como float64: el dtype inferido puede variar entre chunks)
+        key_columns = self.df[dup_columns].astype(
+            {'cantidad': 'float64', 'precio_unitario': 'float64'}
+        )
+        keys = pd.util.hash_pandas_object(key_columns, index=False)
+        is_new = ~keys.duplicated().to_numpy()
+        
+        # Duplicados de chunks anteriores (pipeline en streaming)
+        if self.seen_keys is not None:
+            is_new[is_new] = self.seen_keys.filter_new(keys.to_numpy()[is_new])
+        
+        self.df = self.df[is_new].copy()
         
         self.stats['duplicates_removed'] = original_count - len(self.df)
         logger.info(f"   Duplicados eliminados: {self.stats['duplicates_removed']}")
@@ -341,37 +601,34 @@ class DataTransformer:
         Los registros rechazados se almacenan para auditoría.
         """
         
+        # Condiciones numéricas sobre arrays float64 (NaN > 0 es False,
+        # por lo que también cubren los nulos)
+        cantidad = self.df['cantidad'].to_numpy(dtype='float64', na_value=np.nan)
+        precio = self.df['precio_unitario'].to_numpy(dtype='float64', na_value=np.nan)
+        
+        try:
+            # NumExpr (opcional) evalúa la expresión en un único kernel fusionado
+            import numexpr as ne
+            numeric_ok = ne.evaluate("(cantidad > 0) & (precio > 0)")
+        except ImportError:
+            numeric_ok = (cantidad > 0) & (precio > 0)
+        
         # Definir condiciones de validación
-        valid_mask = (
-            self.df['fecha'].notna() &
-            self.df['cantidad'].notna() &
-            (self.df['cantidad'] > 0) &
-            self.df['precio_unitario'].notna() &
-            (self.df['precio_unitario'] > 0) &
-            self.df['producto'].notna() &
-            (self.df['producto'] != '')
-        )
+        valid_mask = numeric_ok & self.df['fecha'].notna().to_numpy()
+        
+        # Texto obligatorio (NOT NULL en ventas): ni nulo ni vacío
+        for col in self.REQUIRED_TEXT_COLUMNS:
+            valid_mask &= (
+                self.df[col].notna().to_numpy() &
+                (self.df[col] != '').to_numpy(dtype=bool, na_value=False)
+            )
         
         # Separar rechazados
         rejected_df = self.df[~valid_mask].copy()
         self.df = self.df[valid_mask].copy()
         
-        # Almacenar razones de rechazo
-        for idx, row in rejected_df.iterrows():
-            reasons = []
-            if pd.isna(row['fecha']):
-                reasons.append('fecha_nula')
-            if pd.isna(row['cantidad']) or row['cantidad'] <= 0:
-                reasons.append('cantidad_invalida')
-            if pd.isna(row['precio_unitario']) or row['precio_unitario'] <= 0:
-                reasons.append('precio_invalido')
-            if pd.isna(row['producto']) or row['producto'] == '':
-                reasons.append('producto_vacio')
-            
-            self.rejected_records.append({
-                'raw_data': row.to_json(),
-                'rejection_reason': ', '.join(reasons)
-            })
+        # Razones de rechazo y serialización para auditoría
+        self.rejected_records.extend(build_rejected_records(rejected_df))
         
         logger.info(f"   Registros rechazados: {len(self.rejected_records)}")
         
@@ -383,6 +640,11 @@ class DataTransformer:
         # Convertir fecha a formato estándar
         self.df['fecha'] = pd.to_datetime(self.df['fecha']).dt.date
         
+        # Tipos NumPy para la carga (sin nulos tras la validación); una
+        # cantidad no entera se redondea como lo haría MySQL en una columna INT
+        self.df['cantidad'] = np.floor(self.df['cantidad'] + 0.5).astype('int64')
+        self.df['total'] = self.df['total'].astype('float64')
+        
         logger.info("   Metadatos añadidos")
         return self
     
@@ -391,33 +653,199 @@ class DataTransformer:
         return self.df, self.rejected_records, self.stats
 
 
-def transform(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[dict], dict]:
+def transform_polars(
+    df: pd.DataFrame,
+    seen_keys: Optional[SeenKeys] = None
+) -> Tuple[pd.DataFrame, List[dict], dict]:
     """
-    TRANSFORM: Aplica transformaciones y limpieza
+    Variante de las transformaciones de DataTransformer sobre Polars.
+    
+    Limpieza de strings, fechas, numéricos y nulls se expresan como un
+    único plan lazy que Polars fusiona y ejecuta en streaming; luego se
+    eliminan duplicados y se separan los rechazados. Requiere polars y
+    pyarrow instalados.
     
     Args:
         df: DataFrame con datos raw
+        seen_keys: Hashes de clave de duplicado vistos en chunks anteriores
+            (pipeline en streaming)
         
     Returns:
         Tuple con (DataFrame limpio, registros rechazados, estadísticas)
     """
-    logger.info("=" * 60)
-    logger.info("FASE: TRANSFORM")
-    logger.info("=" * 60)
+    import polars as pl
     
-    transformer = DataTransformer(df)
+    string_columns = ['producto', 'categoria', 'region', 'vendedor', 'cliente_id']
+    dup_columns = [
+        'fecha', 'producto', 'cantidad', 
+        'precio_unitario', 'cliente_id'
+    ]
+    
+    lf = pl.from_pandas(df).lazy().with_columns(
+        pl.col(string_columns).cast(pl.Utf8)
+    )
+    
+    # Fechas: tipadas desde EXTRACT o texto ISO / dd/mm/yyyy
+    if pd.api.types.is_datetime64_any_dtype(df['fecha']):
+        fecha_expr = pl.col('fecha').cast(pl.Date)
+    else:
+        fecha_str = pl.col('fecha').cast(pl.Utf8)
+        fecha_expr = pl.coalesce(
+            fecha_str.str.to_date('%Y-%m-%d', strict=False),
+            fecha_str.str.to_date('%d/%m/%Y', strict=False)
+        )
+    
+    # Cantidad numérica: se conserva el tipo entero si ya viene tipada
+    if pd.api.types.is_numeric_dtype(df['cantidad']):
+        cantidad_expr = pl.col('cantidad')
+    else:
+        cantidad_expr = pl.col('cantidad').cast(pl.Float64, strict=False)
+    
+    # Columnas limpias y banderas auxiliares (_*) para las estadísticas;
+    # los nulls cuentan como string cambiado, igual que en clean_strings
+    cleaned = [
+        pl.col(c).str.strip_chars() for c in string_columns if c != 'region'
+    ] + [
+        pl.col('region').str.strip_chars().str.to_titlecase(),
+        fecha_expr.alias('fecha'),
+        cantidad_expr.abs(),
+        pl.col('precio_unitario').cast(pl.Float64, strict=False),
+        pl.sum_horizontal(
+            (pl.col(c).str.strip_chars() != pl.col(c)).fill_null(True)
+            for c in string_columns if c != 'region'
+        ).alias('_strings_changed'),
+        (pl.col('region').str.strip_chars().str.to_titlecase() != pl.col('region'))
+            .fill_null(True).alias('_region_changed'),
+        (cantidad_expr < 0).alias('_negative'),
+        (pl.col('fecha').is_null()).alias('_fecha_null_in'),
+    ]
+    
+    result = (
+        lf
+        .with_columns(cleaned)
+        .with_columns(
+            (pl.col('cantidad') * pl.col('precio_unitario')).round(2).alias('total')
+        )
+        .with_columns(
+            pl.sum_horizontal(
+                pl.col(c).is_null() for c in df.columns
+            ).alias('_nulls')
+        )
+        .with_columns(
+            pl.col('vendedor').fill_null('Sin asignar'),
+            pl.col('cliente_id').fill_null('CLI-00000')
+        )
+        .collect(engine='streaming')
+    )
+    
+    stats_row = result.select(
+        (pl.col('_strings_changed') + pl.col('_region_changed')).sum(),
+        pl.col('_negative').sum(),
+        pl.col('_nulls').sum(),
+        (pl.col('fecha').is_null() & ~pl.col('_fecha_null_in')).sum().alias('_dates')
+    ).row(0)
+    
+    deduped = result.drop(
+        '_strings_changed', '_region_changed', '_negative', '_fecha_null_in', '_nulls'
+    ).unique(subset=dup_columns, keep='first', maintain_order=True)
+    
+    # Duplicados de chunks anteriores (pipeline en streaming)
+    if seen_keys is not None:
+        keys = deduped.select(
+            pl.struct(
+                pl.col(dup_columns).exclude('cantidad', 'precio_unitario'),
+                pl.col('cantidad', 'precio_unitario').cast(pl.Float64)
+            ).hash()
+        ).to_series().to_numpy()
+        deduped = deduped.filter(pl.Series(seen_keys.filter_new(keys)))
+    
+    valid = (
+        pl.col('fecha').is_not_null() &
+        (pl.col('cantidad') > 0).fill_null(False) &
+        (pl.col('precio_unitario') > 0).fill_null(False) &
+        pl.all_horizontal(
+            pl.col(col).is_not_null() & (pl.col(col) != '')
+            for col in DataTransformer.REQUIRED_TEXT_COLUMNS
+        )
+    )
+    # Cantidad entera para la carga, redondeada como en add_metadata
+    valid_df = deduped.filter(valid).with_columns(
+        (pl.col('cantidad').cast(pl.Float64) + 0.5).floor().cast(pl.Int64)
+    )
+    rejected_df = deduped.filter(~valid)
+    
+    stats = {
+        'original_count': len(df),
+        'nulls_fixed': stats_row[2],
+        'duplicates_removed': len(result) - len(deduped),
+        'dates_fixed': stats_row[3],
+        'negatives_fixed': stats_row[1],
+        'strings_cleaned': stats_row[0]
+    }
+    rejected = build_rejected_records(rejected_df.to_pandas())
+    df_clean = valid_df.to_pandas(use_pyarrow_extension_array=True)
+    
+    logger.info(f"   Strings limpiados: {stats['strings_cleaned']}")
+    logger.info(f"   Fechas convertidas (problemas: {stats['dates_fixed']})")
+    logger.info(f"   Valores negativos corregidos: {stats['negatives_fixed']}")
+    logger.info(f"   Valores nulos tratados: {stats['nulls_fixed']}")
+    logger.info(f"   Duplicados eliminados: {stats['duplicates_removed']}")
+    logger.info(f"   Registros rechazados: {len(rejected)}")
+    
+    return df_clean, rejected, stats
+
+
+def run_transformations(
+    df: pd.DataFrame,
+    seen_keys: Optional[SeenKeys] = None
+) -> Tuple[pd.DataFrame, List[dict], dict]:
+    """
+    Aplica las transformaciones con el motor configurado
+    (etl_config.transform_engine).
+    
+    Args:
+        df: DataFrame con datos raw (se modifica en sitio; no reutilizar)
+        seen_keys: Hashes de clave de duplicado vistos en chunks anteriores
+            (pipeline en streaming)
+        
+    Returns:
+        Tuple con (DataFrame limpio, registros rechazados, estadísticas)
+    """
+    engine = etl_config.transform_engine
+    
+    if engine == 'polars':
+        return transform_polars(df, seen_keys)
+    
+    if engine != 'pandas':
+        raise ValueError(f"Motor de transformación no soportado: {engine}")
     
     # Aplicar transformaciones en secuencia
-    transformer \
+    return DataTransformer(df, seen_keys) \
         .clean_strings() \
         .fix_dates() \
         .fix_numeric_values() \
         .handle_nulls() \
         .remove_duplicates() \
         .validate_and_reject() \
-        .add_metadata()
+        .add_metadata() \
+        .get_result()
+
+
+def transform(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[dict], dict]:
+    """
+    TRANSFORM: Aplica transformaciones y limpieza
+    
+    Args:
+        df: DataFrame con datos raw (se modifica en sitio; no reutilizar)
+        
+    Returns:
+        Tuple con (DataFrame limpio, registros rechazados, estadísticas)
+    """
+    logger.info("=" * 60)
+    logger.info("FASE: TRANSFORM")
+    logger.info("=" * 60)
     
-    df_clean, rejected, stats = transformer.get_result()
+    df_clean, rejected, stats = run_transformations(df)
     
     # Resumen de transformación
     logger.info("-" * 40)
@@ -433,6 +861,56 @@ def transform(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[dict], dict]:
 # FASE LOAD
 # ============================================================
 
+def split_sql_script(sql_script: str) -> List[str]:
+    """
+    Divide un script SQL en bloques ejecutables con execute_multi.
+    
+    DELIMITER es una directiva del cliente mysql, no del servidor: el
+    texto con delimitador ';' se devuelve como un único bloque, y las
+    sentencias con delimitador propio (procedimientos) una por una.
+    
+    Args:
+        sql_script: Contenido del archivo .sql
+        
+    Returns:
+        Lista de bloques SQL no vacíos
+    """
+    blocks = []
+    delimiter = ';'
+    current = []
+    
+    def flush():
+        text = '\n'.join(current).strip()
+        current.clear()
+        if not text:
+            return
+        if delimiter == ';':
+            blocks.append(text)
+        else:
+            blocks.extend(
+                statement.strip()
+                for statement in text.split(delimiter)
+                if statement.strip()
+            )
+    
+    for line in sql_script.splitlines():
+        if line.strip().upper().startswith('DELIMITER'):
+            flush()
+            delimiter = line.split()[1]
+        else:
+            current.append(line)
+    flush()
+    
+    # Descartar bloques que solo contienen comentarios
+    return [
+        block for block in blocks
+        if any(
+            line.strip() and not line.strip().startswith('--')
+            for line in block.splitlines()
+        )
+    ]
+
+
 def create_tables(conn: MySQLConnection) -> bool:
     """Crea las tablas necesarias si no existen"""
     
@@ -445,16 +923,10 @@ def create_tables(conn: MySQLConnection) -> bool:
         with open(sql_path, 'r', encoding='utf-8') as f:
             sql_script = f.read()
         
-        # Ejecutar cada statement
-        for statement in sql_script.split(';'):
-            statement = statement.strip()
-            if statement and not statement.startswith('--'):
-                try:
-                    conn.execute(statement)
-                except MySQLError as e:
-                    # Ignorar ciertos errores esperados
-                    if 'already exists' not in str(e).lower():
-                        logger.warning(f"SQL Warning: {e}")
+        # Ejecutar cada bloque del script en un solo round-trip; el
+        # script es idempotente, así que cualquier error es real
+        for block in split_sql_script(sql_script):
+            conn.execute_multi(block)
         
         conn.commit()
         logger.info("   Tablas verificadas/creadas")
@@ -483,6 +955,326 @@ def create_tables(conn: MySQLConnection) -> bool:
         return True
 
 
+# Columnas de la tabla ventas en el orden de carga
+VENTAS_COLUMNS = [
+    'fecha', 'producto', 'categoria', 'cantidad', 
+    'precio_unitario', 'total', 'cliente_id', 
+    'region', 'vendedor'
+]
+
+
+@contextmanager
+def bulk_load_session(conn: MySQLConnection):
+    """
+    Relaja chequeos de la sesión durante la carga masiva de ventas.
+    
+    Desactiva unique_checks y foreign_key_checks (InnoDB omite la
+    verificación por fila) y, solo si etl_config.disable_binlog está
+    activo, el binlog de la sesión. Los valores se restauran al salir.
+    """
+    conn.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+    
+    # Sin binlog la carga no llega a réplicas ni a la recuperación
+    # point-in-time: solo bajo opción explícita (requiere privilegios)
+    log_bin_disabled = False
+    if etl_config.disable_binlog:
+        try:
+            conn.cursor.execute("SET SESSION sql_log_bin = 0")
+            log_bin_disabled = True
+            logger.info("   Binlog desactivado para la carga (disable_binlog)")
+        except MySQLError as e:
+            logger.warning(f"   sql_log_bin no modificado: {e}")
+    
+    try:
+        yield conn
+    finally:
+        try:
+            conn.execute("SET SESSION unique_checks = 1, foreign_key_checks = 1")
+            if log_bin_disabled:
+                conn.execute("SET SESSION sql_log_bin = 1")
+        except MySQLError as e:
+            # No ocultar el error original de la carga
+            logger.warning(f"No se pudo restaurar la sesión: {e}")
+
+
+def load_data_infile(conn: MySQLConnection, df: pd.DataFrame) -> int:
+    """
+    Carga ventas con LOAD DATA LOCAL INFILE a partir de un CSV temporal.
+    
+    El servidor parsea las filas en un único statement, evitando el
+    parseo/bind por fila de los INSERT.
+    
+    No hace commit: la carga se confirma junto con el resto de load().
+    
+    Returns:
+        Número de registros cargados
+    """
+    logger.info(f"Cargando {len(df):,} registros con LOAD DATA LOCAL INFILE...")
+    
+    with tempfile.NamedTemporaryFile(
+        mode='w', suffix='.csv', encoding='utf-8', newline='', delete=False
+    ) as tmp:
+        df[VENTAS_COLUMNS].to_csv(
+            tmp,
+            index=False,
+            header=False,
+            na_rep='NULL',
+            date_format='%Y-%m-%d',
+            lineterminator='\n'
+        )
+        tmp_path = tmp.name
+    
+    try:
+        # MySQL espera '/' como separador también en Windows
+        infile = tmp_path.replace('\\', '/')
+        query = f"""
+        LOAD DATA LOCAL INFILE '{infile}'
+        INTO TABLE ventas
+        CHARACTER SET utf8mb4
+        FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY ''
+        LINES TERMINATED BY '\\n'
+        ({', '.join(VENTAS_COLUMNS)})
+        """
+        cursor = conn.execute(query)
+        loaded = cursor.rowcount
+        
+        # Con LOCAL, los errores de conversión y NOT NULL llegan como
+        # advertencias: no se da por buena una carga con advertencias
+        if cursor.warning_count:
+            warning_count = cursor.warning_count
+            conn.execute("SHOW WARNINGS LIMIT 5")
+            for warning in conn.cursor.fetchall():
+                logger.error(
+                    f"   LOAD DATA {warning['Level']} {warning['Code']}: {warning['Message']}"
+                )
+            raise ValueError(
+                f"LOAD DATA generó {warning_count} advertencias; carga descartada"
+            )
+        
+        return loaded
+    finally:
+        os.remove(tmp_path)
+
+
+def insert_records(conn: MySQLConnection, records: List[tuple], slice_id: int = 0) -> int:
+    """
+    Inserta registros en `conn` con un INSERT multi-fila por batch.
+    
+    No hace commit: lo decide quien llama (insert_slice o la
+    transacción de load()).
+    
+    Returns:
+        Número de registros insertados
+    """
+    # Preparar INSERT multi-fila: un solo statement por batch
+    insert_prefix = f"""
+    INSERT INTO ventas 
+    ({', '.join(VENTAS_COLUMNS)})
+    VALUES """
+    placeholders = "(" + ", ".join(["%s"] * len(VENTAS_COLUMNS)) + ")"
+    
+    batch_size = etl_config.batch_size
+    total_inserted = 0
+    
+    for i in range(0, len(records), batch_size):
+        batch = records[i:i + batch_size]
+        
+        try:
+            query = insert_prefix + ", ".join([placeholders] * len(batch))
+            params = tuple(value for row in batch for value in row)
+            conn.execute(query, params)
+            total_inserted += len(batch)
+            
+            # Mostrar progreso (sin formatear si DEBUG está desactivado)
+            if logger.isEnabledFor(logging.DEBUG):
+                progress = (i + len(batch)) / len(records) * 100
+                logger.debug(
+                    f"   Porción {slice_id} - Progreso: {progress:.1f}% "
+                    f"({total_inserted:,} registros)"
+                )
+            
+        except MySQLError as e:
+            logger.error(f"Error en porción {slice_id}, batch {i//batch_size}: {e}")
+            raise
+    
+    return total_inserted
+
+
+def insert_slice(records: List[tuple], slice_id: int) -> int:
+    """
+    Inserta una porción de registros en su propia conexión del pool.
+    
+    Usa un INSERT multi-fila por batch y un único commit al final;
+    ante un error hace rollback de la porción y relanza la excepción.
+    
+    Returns:
+        Número de registros insertados
+    """
+    with get_mysql_connection() as conn, bulk_load_session(conn):
+        try:
+            total_inserted = insert_records(conn, records, slice_id)
+        except Exception:
+            conn.rollback()
+            raise
+        
+        conn.commit()
+    
+    return total_inserted
+
+
+def insert_batches(conn: MySQLConnection, df: pd.DataFrame) -> int:
+    """
+    Carga ventas con INSERT multi-fila repartidos entre varios hilos.
+    
+    Los registros se dividen en porciones contiguas; cada hilo toma
+    su propia conexión del pool (la conexión `conn` ya ocupa una).
+    Si alguna porción falla se cancelan las pendientes y se vacía
+    la tabla para no dejar una carga parcial. Con un pool de una sola
+    conexión se inserta en serie sobre `conn`, sin commit.
+    
+    Returns:
+        Número de registros insertados
+    """
+    # Convertir DataFrame a lista de tuplas: tolist() por columna usa la
+    # ruta nativa de cada dtype y zip arma las filas sin ndarray de objetos
+    columns = [df[col].tolist() for col in VENTAS_COLUMNS]
+    records = list(zip(*columns))
+    
+    batch_size = etl_config.batch_size
+    workers = mysql_config.pool_size - 1
+    
+    # Sin conexiones libres en el pool: inserción en serie en la
+    # transacción de `conn` (el rollback de load() la deshace)
+    if workers < 1:
+        logger.info(f"Insertando {len(records):,} registros (batch size: {batch_size})...")
+        return insert_records(conn, records)
+    
+    # Porciones alineadas al batch size, una por hilo
+    num_batches = -(-len(records) // batch_size)
+    batches_per_slice = max(1, -(-num_batches // workers))
+    slice_size = batches_per_slice * batch_size
+    slices = [
+        records[i:i + slice_size]
+        for i in range(0, len(records), slice_size)
+    ]
+    
+    logger.info(
+        f"Insertando {len(records):,} registros "
+        f"(batch size: {batch_size}, hilos: {len(slices)})..."
+    )
+    
+    total_inserted = 0
+    
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(insert_slice, records_slice, slice_id)
+                for slice_id, records_slice in enumerate(slices)
+            ]
+            try:
+                for future in as_completed(futures):
+                    total_inserted += future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    except Exception:
+        # Cualquier fallo de una porción (MySQL, conversión de tipos...):
+        # las porciones confirmadas se descartan, full refresh atómico
+        logger.warning("Carga interrumpida, vaciando tabla ventas...")
+        conn.execute("TRUNCATE TABLE ventas")
+        conn.commit()
+        raise
+    
+    return total_inserted
+
+
+def prepare_tables(conn: MySQLConnection):
+    """Crea las tablas y vacía ventas (carga full refresh)"""
+    
+    # Crear tablas
+    create_tables(conn)
+    
+    # Truncar tabla de ventas (carga full refresh)
+    logger.info("Truncando tabla ventas...")
+    conn.execute("TRUNCATE TABLE ventas")
+    conn.commit()
+
+
+def load_ventas(
+    conn: MySQLConnection,
+    df: pd.DataFrame,
+    use_load_data: bool
+) -> Tuple[int, bool]:
+    """
+    Carga registros limpios en ventas.
+    
+    Usa LOAD DATA LOCAL INFILE y, si el servidor lo rechaza, INSERT
+    multi-fila como respaldo.
+    
+    Returns:
+        Tuple con (registros cargados, si LOAD DATA sigue disponible)
+    """
+    if use_load_data:
+        try:
+            return load_data_infile(conn, df), True
+        except MySQLError as e:
+            # InnoDB deshace solo la sentencia fallida; los chunks previos
+            # sin commit de la misma transacción se conservan
+            logger.warning(f"LOAD DATA no disponible, usando INSERT: {e}")
+    
+    return insert_batches(conn, df), False
+
+
+def discard_partial_load(conn: MySQLConnection, insert_used: bool):
+    """
+    Deshace una carga fallida de ventas (full refresh atómico).
+    
+    El rollback cubre LOAD DATA y los rechazados de `conn`, pero las
+    porciones de insert_batches se confirman en sus propias conexiones:
+    si se usó INSERT, la tabla se vacía como en insert_batches.
+    """
+    conn.rollback()
+    
+    if insert_used:
+        try:
+            logger.warning("Carga interrumpida, vaciando tabla ventas...")
+            conn.execute("TRUNCATE TABLE ventas")
+            conn.commit()
+        except MySQLError as e:
+            # No ocultar el error original de la carga
+            logger.error(f"No se pudo vaciar la tabla ventas: {e}")
+
+
+def save_rejected(conn: MySQLConnection, rejected: List[dict], execution_id: str):
+    """Inserta registros rechazados (si hay tabla de rejected); sin commit"""
+    if not rejected:
+        return
+    
+    try:
+        reject_query = """
+        INSERT INTO ventas_rejected 
+        (execution_id, raw_data, rejection_reason)
+        VALUES (%s, %s, %s)
+        """
+        reject_records = [
+            (execution_id, r['raw_data'], r['rejection_reason']) 
+            for r in rejected
+        ]
+        conn.executemany(reject_query, reject_records)
+        logger.info(f"   Rechazados registrados: {len(rejected)}")
+    except MySQLError as e:
+        logger.warning(f"No se pudieron guardar rechazados: {e}")
+
+
+def verify_load(conn: MySQLConnection):
+    """Verifica la carga contando los registros de ventas"""
+    conn.execute("SELECT COUNT(*) as count FROM ventas")
+    result = conn.cursor.fetchone()
+    logger.info(f"   Total en tabla ventas: {result['count']:,}")
+
+
 def load(
     df: pd.DataFrame, 
     rejected: List[dict],
@@ -505,78 +1297,220 @@ def load(
     
     with get_mysql_connection() as conn:
         
-        # Crear tablas
-        create_tables(conn)
-        
-        # Truncar tabla de ventas (carga full refresh)
-        logger.info("Truncando tabla ventas...")
-        conn.execute("TRUNCATE TABLE ventas")
-        conn.commit()
+        prepare_tables(conn)
         
-        # Preparar INSERT
-        insert_query = """
-        INSERT INTO ventas 
-        (fecha, producto, categoria, cantidad, precio_unitario, 
-         total, cliente_id, region, vendedor)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        use_load_data = etl_config.use_load_data
+        try:
+            # Carga masiva: LOAD DATA LOCAL INFILE, con INSERT como respaldo
+            with bulk_load_session(conn):
+                total_inserted, use_load_data = load_ventas(conn, df, use_load_data)
+            logger.info(f"✅ Registros insertados: {total_inserted:,}")
+            
+            save_rejected(conn, rejected, execution_id)
+            
+            # Un único commit para ventas y rechazados
+            conn.commit()
+        except Exception:
+            discard_partial_load(conn, insert_used=not use_load_data)
+            raise
         
-        # Convertir DataFrame a lista de tuplas
-        records = df[[
-            'fecha', 'producto', 'categoria', 'cantidad', 
-            'precio_unitario', 'total', 'cliente_id', 
-            'region', 'vendedor'
-        ]].values.tolist()
+        verify_load(conn)
         
-        # Insertar en batches
-        batch_size = etl_config.batch_size
-        total_inserted = 0
+        return total_inserted, len(rejected)
+
+
+# ============================================================
+# PIPELINE EN STREAMING
+# ============================================================
+
+# Marca de fin de stream en las colas
+_END_OF_STREAM = object()
+
+
+def _queue_put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Encola respetando la contrapresión; abandona si el pipeline se detuvo"""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _queue_get(q: queue.Queue, stop: threading.Event) -> Any:
+    """Desencola; retorna _END_OF_STREAM si el pipeline se detuvo"""
+    while True:
+        try:
+            return q.get(timeout=0.5)
+        except queue.Empty:
+            if stop.is_set():
+                return _END_OF_STREAM
+
+
+def extract_chunks(filepath: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    EXTRACT por bloques: lee el CSV en chunks con los tipos de CSV_DTYPES.
+    
+    Args:
+        filepath: Ruta al archivo CSV
+        chunksize: Registros por chunk
         
-        logger.info(f"Insertando {len(records):,} registros (batch size: {batch_size})...")
+    Yields:
+        DataFrames raw de hasta `chunksize` registros
+    """
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"Archivo no encontrado: {filepath}")
+    
+    logger.info(f"Leyendo archivo por bloques de {chunksize:,}: {filepath}")
+    
+    with pd.read_csv(
+        filepath,
+        encoding='utf-8',
+        dtype=CSV_DTYPES,
+        chunksize=chunksize
+    ) as reader:
+        yield from reader
+
+
+def stream_etl(filepath: str, execution_id: str) -> dict:
+    """
+    Ejecuta EXTRACT → TRANSFORM → LOAD en streaming por chunks.
+    
+    Un hilo lee chunks del CSV y otro los transforma mientras el hilo
+    principal carga el anterior; las colas acotadas (queue_size) aplican
+    contrapresión para no acumular chunks en memoria. Los duplicados se
+    detectan también entre chunks. Cada chunk se transforma con el motor
+    configurado (run_transformations).
+    
+    Args:
+        filepath: Ruta al archivo CSV
+        execution_id: ID único de ejecución
         
-        for i in range(0, len(records), batch_size):
-            batch = records[i:i + batch_size]
+    Returns:
+        Diccionario de métricas por etapa (extract, transform, load)
+    """
+    logger.info("=" * 60)
+    logger.info("FASES: EXTRACT → TRANSFORM → LOAD (streaming)")
+    logger.info("=" * 60)
+    
+    q_extract = queue.Queue(maxsize=etl_config.queue_size)
+    q_load = queue.Queue(maxsize=etl_config.queue_size)
+    stop = threading.Event()
+    errors = []
+    
+    stages = {
+        'extract': {'records': 0, 'duration': 0.0},
+        'transform': {'records_in': 0, 'records_out': 0, 'rejected': 0, 'duration': 0.0},
+        'load': {'records_inserted': 0, 'duration': 0.0}
+    }
+    transform_stats = {}
+    rejected = []
+    
+    def producer():
+        try:
+            reader = extract_chunks(filepath, etl_config.chunk_size)
+            while True:
+                chunk_start = datetime.now()
+                chunk = next(reader, None)
+                stages['extract']['duration'] += (datetime.now() - chunk_start).total_seconds()
+                if chunk is None:
+                    break
+                stages['extract']['records'] += len(chunk)
+                if not _queue_put(q_extract, chunk, stop):
+                    return
+        except Exception as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            _queue_put(q_extract, _END_OF_STREAM, stop)
+    
+    def transformer():
+        seen_keys = SeenKeys()
+        try:
+            while True:
+                chunk = _queue_get(q_extract, stop)
+                if chunk is _END_OF_STREAM:
+                    break
+                chunk_start = datetime.now()
+                df_clean, chunk_rejected, stats = run_transformations(chunk, seen_keys)
+                stages['transform']['duration'] += (datetime.now() - chunk_start).total_seconds()
+                
+                for key, value in stats.items():
+                    transform_stats[key] = transform_stats.get(key, 0) + value
+                rejected.extend(chunk_rejected)
+                
+                if not _queue_put(q_load, df_clean, stop):
+                    return
+        except Exception as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            _queue_put(q_load, _END_OF_STREAM, stop)
+    
+    threads = [
+        threading.Thread(target=producer, name='etl-extract', daemon=True),
+        threading.Thread(target=transformer, name='etl-transform', daemon=True)
+    ]
+    for thread in threads:
+        thread.start()
+    
+    try:
+        with get_mysql_connection() as conn:
+            prepare_tables(conn)
             
+            use_load_data = etl_config.use_load_data
             try:
-                conn.executemany(insert_query, batch)
-                conn.commit()
-                total_inserted += len(batch)
+                chunk_number = 0
+                with bulk_load_session(conn):
+                    while True:
+                        df_clean = _queue_get(q_load, stop)
+                        if df_clean is _END_OF_STREAM:
+                            break
+                        
+                        chunk_number += 1
+                        chunk_start = datetime.now()
+                        inserted, use_load_data = load_ventas(conn, df_clean, use_load_data)
+                        stages['load']['duration'] += (datetime.now() - chunk_start).total_seconds()
+                        stages['load']['records_inserted'] += inserted
+                        logger.info(
+                            f"   Chunk {chunk_number}: {inserted:,} registros cargados "
+                            f"(total: {stages['load']['records_inserted']:,})"
+                        )
                 
-                # Mostrar progreso
-                progress = (i + len(batch)) / len(records) * 100
-                logger.debug(f"   Progreso: {progress:.1f}% ({total_inserted:,} registros)")
+                for thread in threads:
+                    thread.join()
+                if errors:
+                    raise errors[0]
                 
-            except MySQLError as e:
-                logger.error(f"Error en batch {i//batch_size}: {e}")
-                conn.rollback()
-                raise
-        
-        logger.info(f"✅ Registros insertados: {total_inserted:,}")
-        
-        # Insertar registros rechazados (si hay tabla de rejected)
-        if rejected:
-            try:
-                reject_query = """
-                INSERT INTO ventas_rejected 
-                (execution_id, raw_data, rejection_reason)
-                VALUES (%s, %s, %s)
-                """
-                reject_records = [
-                    (execution_id, r['raw_data'], r['rejection_reason']) 
-                    for r in rejected
-                ]
-                conn.executemany(reject_query, reject_records)
+                logger.info(f"✅ Registros insertados: {stages['load']['records_inserted']:,}")
+                
+                save_rejected(conn, rejected, execution_id)
+                
+                # Un único commit para todos los chunks y los rechazados
                 conn.commit()
-                logger.info(f"   Rechazados registrados: {len(rejected)}")
-            except MySQLError as e:
-                logger.warning(f"No se pudieron guardar rechazados: {e}")
-        
-        # Verificar carga
-        conn.execute("SELECT COUNT(*) as count FROM ventas")
-        result = conn.cursor.fetchone()
-        logger.info(f"   Total en tabla ventas: {result['count']:,}")
-        
-        return total_inserted, len(rejected)
+            except Exception:
+                discard_partial_load(conn, insert_used=not use_load_data)
+                raise
+            
+            verify_load(conn)
+    
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+    
+    stages['transform']['records_in'] = transform_stats.get('original_count', 0)
+    stages['transform']['records_out'] = stages['load']['records_inserted']
+    stages['transform']['rejected'] = len(rejected)
+    
+    # Resumen de transformación
+    logger.info("-" * 40)
+    logger.info("Resumen de Transformación:")
+    for key, value in transform_stats.items():
+        logger.info(f"   {key}: {value:,}")
+    
+    return stages
 
 
 # ============================================================
@@ -590,7 +1524,7 @@ def run_etl() -> dict:
     Returns:
         Diccionario con métricas de ejecución
     """
-    execution_id = str(uuid.uuid4())[:8]
+    execution_id = secrets.token_hex(4)
     start_time = datetime.now()
     
     logger.info("*" * 60)
@@ -607,31 +1541,37 @@ def run_etl() -> dict:
     }
     
     try:
-        # EXTRACT
-        extract_start = datetime.now()
-        df_raw = extract(etl_config.csv_path)
-        metrics['stages']['extract'] = {
-            'records': len(df_raw),
-            'duration': (datetime.now() - extract_start).total_seconds()
-        }
+        if etl_config.streaming:
+            # EXTRACT → TRANSFORM → LOAD solapados por chunks
+            metrics['stages'] = stream_etl(etl_config.csv_path, execution_id)
         
-        # TRANSFORM
-        transform_start = datetime.now()
-        df_clean, rejected, transform_stats = transform(df_raw)
-        metrics['stages']['transform'] = {
-            'records_in': transform_stats['original_count'],
-            'records_out': len(df_clean),
-            'rejected': len(rejected),
-            'duration': (datetime.now() - transform_start).total_seconds()
-        }
-        
-        # LOAD
-        load_start = datetime.now()
-        inserted, rejected_count = load(df_clean, rejected, execution_id)
-        metrics['stages']['load'] = {
-            'records_inserted': inserted,
-            'duration': (datetime.now() - load_start).total_seconds()
-        }
+        else:
+            # EXTRACT
+            extract_start = datetime.now()
+            df_raw = extract(etl_config.csv_path)
+            metrics['stages']['extract'] = {
+                'records': len(df_raw),
+                'duration': (datetime.now() - extract_start).total_seconds()
+            }
+            
+            # TRANSFORM
+            transform_start = datetime.now()
+            df_clean, rejected, transform_stats = transform(df_raw)
+            del df_raw  # transform() tomó posesión del DataFrame raw
+            metrics['stages']['transform'] = {
+                'records_in': transform_stats['original_count'],
+                'records_out': len(df_clean),
+                'rejected': len(rejected),
+                'duration': (datetime.now() - transform_start).total_seconds()
+            }
+            
+            # LOAD
+            load_start = datetime.now()
+            inserted, rejected_count = load(df_clean, rejected, execution_id)
+            metrics['stages']['load'] = {
+                'records_inserted': inserted,
+                'duration': (datetime.now() - load_start).total_seconds()
+            }
         
         # Éxito
         metrics['status'] = 'COMPLETED'
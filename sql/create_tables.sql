@@ -1,16 +1,14 @@
 -- =============================================
 -- Script DDL: Creación de tablas para ETL
--- Base de datos: etl_ventas
+-- Base de datos: la de la conexión (MYSQL_DATABASE)
+--
+-- Idempotente: el ETL lo ejecuta en cada corrida, por lo que
+-- no elimina tablas ni datos (etl_log y ventas_rejected
+-- conservan el historial de auditoría).
 -- =============================================
 
--- Usar la base de datos
-USE etl_ventas;
-
--- Eliminar tabla si existe (para recreación limpia)
-DROP TABLE IF EXISTS ventas;
-
 -- Crear tabla principal de ventas
-CREATE TABLE ventas (
+CREATE TABLE IF NOT EXISTS ventas (
     id INT AUTO_INCREMENT PRIMARY KEY,
     fecha DATE NOT NULL,
     producto VARCHAR(100) NOT NULL,
@@ -34,9 +32,7 @@ CREATE TABLE ventas (
 
 
 -- Tabla de log para auditoría del ETL
-DROP TABLE IF EXISTS etl_log;
-
-CREATE TABLE etl_log (
+CREATE TABLE IF NOT EXISTS etl_log (
     id INT AUTO_INCREMENT PRIMARY KEY,
     execution_id VARCHAR(50) NOT NULL,
     stage VARCHAR(50) NOT NULL,  -- 'EXTRACT', 'TRANSFORM', 'LOAD'
@@ -55,9 +51,7 @@ CREATE TABLE etl_log (
 
 
 -- Tabla para registros rechazados
-DROP TABLE IF EXISTS ventas_rejected;
-
-CREATE TABLE ventas_rejected (
+CREATE TABLE IF NOT EXISTS ventas_rejected (
     id INT AUTO_INCREMENT PRIMARY KEY,
     execution_id VARCHAR(50) NOT NULL,
     raw_data TEXT NOT NULL,
@@ -113,8 +107,11 @@ ORDER BY anio DESC, mes DESC;
 
 
 -- Procedimiento para limpiar datos antiguos (retención de 2 años)
+-- Se recrea en cada corrida para que el script siga siendo idempotente
 DELIMITER //
 
+DROP PROCEDURE IF EXISTS sp_limpiar_datos_antiguos //
+
 CREATE PROCEDURE sp_limpiar_datos_antiguos()
 BEGIN
     DECLARE cutoff_date DATE;
@@ -0,0 +1,16 @@
+"""
+Configuración común de los tests.
+
+etl_pipeline configura el logging al importarse; se redirige el
+directorio de logs a una carpeta temporal para no escribir en logs/.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import etl_config  # noqa: E402
+
+etl_config.logs_dir = tempfile.mkdtemp(prefix='etl_logs_')
@@ -0,0 +1,414 @@
+"""
+Tests del pipeline ETL (sin servidor MySQL).
+
+Uso:
+    python -m pytest -q
+"""
+
+import os
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import etl_pipeline
+from config import MySQLConfig, etl_config, mysql_config
+from etl_pipeline import (
+    DataTransformer, SeenKeys, bulk_load_session, extract, run_transformations,
+    split_sql_script, transform, transform_polars
+)
+
+
+CSV_HEADER = (
+    "fecha,producto,categoria,cantidad,precio_unitario,total,"
+    "cliente_id,region,vendedor\n"
+)
+
+
+def write_csv(tmp_path, rows):
+    """Escribe un CSV de ventas con las filas dadas"""
+    path = tmp_path / "ventas.csv"
+    path.write_text(CSV_HEADER + "".join(row + "\n" for row in rows), encoding="utf-8")
+    return str(path)
+
+
+def test_extract_accepts_malformed_numeric_values(tmp_path):
+    """Los numéricos malformados se rechazan en TRANSFORM, no abortan EXTRACT"""
+    path = write_csv(tmp_path, [
+        "2024-01-05,Laptop HP,Laptops,2,100.0,200.0,CLI-1,Lima Sur,Ana",
+        "2024-01-06,Laptop HP,Laptops,abc,100.0,0,CLI-2,Lima Sur,Ana",
+        "2024-01-07,Laptop HP,Laptops,2.5,100.0,250.0,CLI-3,Lima Sur,Ana",
+        "2024-01-08,Laptop HP,Laptops,1,$12,0,CLI-4,Lima Sur,Ana",
+    ])
+
+    df_clean, rejected, stats = transform(extract(path))
+
+    assert list(df_clean['cliente_id']) == ['CLI-1', 'CLI-3']
+    assert list(df_clean['cantidad']) == [2, 3]
+    assert [r['rejection_reason'] for r in rejected] == [
+        'cantidad_invalida',
+        'precio_invalido',
+    ]
+
+
+def test_missing_region_or_categoria_is_rejected(tmp_path):
+    """region y categoria son NOT NULL en ventas: nulos o vacíos se rechazan"""
+    path = write_csv(tmp_path, [
+        "2024-01-05,Laptop HP,Laptops,2,100.0,200.0,CLI-1,Lima Sur,Ana",
+        "2024-01-06,Laptop HP,Laptops,2,100.0,200.0,CLI-2,,Ana",
+        "2024-01-07,Laptop HP,  ,2,100.0,200.0,CLI-3,Lima Sur,Ana",
+        "2024-01-08,,Laptops,2,100.0,200.0,CLI-4,Lima Sur,Ana",
+    ])
+
+    df_clean, rejected, stats = transform(extract(path))
+
+    assert list(df_clean['cliente_id']) == ['CLI-1']
+    assert df_clean['region'].notna().all()
+    assert [r['rejection_reason'] for r in rejected] == [
+        'region_vacia',
+        'categoria_vacia',
+        'producto_vacio',
+    ]
+
+
+def run_pandas_engine(df):
+    """Cadena de transformaciones del motor pandas (DataTransformer)"""
+    transformer = DataTransformer(df)
+    transformer.clean_strings()
+    transformer.fix_dates()
+    transformer.fix_numeric_values()
+    transformer.handle_nulls()
+    transformer.remove_duplicates()
+    transformer.validate_and_reject()
+    transformer.add_metadata()
+    return transformer.get_result()
+
+
+def as_comparable(df):
+    """Normaliza tipos (categorías, extensiones Arrow) para comparar motores"""
+    return df.reset_index(drop=True).astype(object).astype(str)
+
+
+@pytest.mark.parametrize('source', ['repo', 'dirty'])
+def test_polars_engine_matches_pandas(tmp_path, source):
+    """transform_polars produce el mismo resultado que DataTransformer"""
+    pytest.importorskip('polars')
+    
+    if source == 'repo':
+        path = etl_config.csv_path
+    else:
+        path = write_csv(tmp_path, [
+            "2024-01-05, laptop hp ,Laptops,2,100.0,200.0,,lima sur,",
+            "2024-01-05, laptop hp ,Laptops,2,100.0,200.0,,lima sur,",
+            "06/01/2024,Monitor LG,Monitores,-3,50.5,151.5,CLI-2,Cusco,Ana",
+            ",Monitor LG,Monitores,1,50.5,50.5,CLI-3,Cusco,Ana",
+            "2024-01-08,Monitor LG,Monitores,abc,50.5,0,CLI-4,,Ana",
+        ])
+    
+    pandas_clean, pandas_rejected, pandas_stats = run_pandas_engine(extract(path))
+    polars_clean, polars_rejected, polars_stats = transform_polars(extract(path))
+    
+    pd.testing.assert_frame_equal(
+        as_comparable(pandas_clean), as_comparable(polars_clean)
+    )
+    assert {k: int(v) for k, v in pandas_stats.items()} == polars_stats
+    assert pandas_rejected == polars_rejected
+
+
+def test_seen_keys_filters_keys_from_previous_chunks():
+    """SeenKeys marca como nuevas solo las claves no vistas antes"""
+    seen = SeenKeys()
+    
+    first = seen.filter_new(np.array([5, 1, 2**64 - 1], dtype=np.uint64))
+    second = seen.filter_new(np.array([0, 1, 7, 2**64 - 1], dtype=np.uint64))
+    
+    assert first.tolist() == [True, True, True]
+    assert second.tolist() == [True, False, True, False]
+    assert len(seen) == 5
+
+
+def test_duplicates_are_removed_across_chunks(tmp_path):
+    """Un registro repetido en otro chunk se descarta en remove_duplicates"""
+    path = write_csv(tmp_path, [
+        "2024-01-05,Laptop HP,Laptops,2,100.0,200.0,CLI-1,Lima Sur,Ana",
+        "2024-01-06,Laptop HP,Laptops,2,100.0,200.0,CLI-2,Lima Sur,Ana",
+        "2024-01-05,Laptop HP,Laptops,2,100.0,200.0,CLI-1,Lima Sur,Ana",
+    ])
+    df = extract(path)
+    seen = SeenKeys()
+    
+    first = DataTransformer(df.iloc[:2].copy(), seen).remove_duplicates().df
+    second = DataTransformer(df.iloc[2:].copy(), seen).remove_duplicates().df
+    
+    assert list(first['cliente_id']) == ['CLI-1', 'CLI-2']
+    assert second.empty
+
+
+@pytest.mark.parametrize('engine', ['pandas', 'polars'])
+def test_run_transformations_uses_configured_engine_per_chunk(tmp_path, monkeypatch, engine):
+    """Cada chunk del streaming pasa por el motor configurado"""
+    if engine == 'polars':
+        pytest.importorskip('polars')
+    monkeypatch.setattr(etl_config, 'transform_engine', engine)
+    path = write_csv(tmp_path, [
+        "2024-01-05,Laptop HP,Laptops,2,100.0,200.0,CLI-1,Lima Sur,Ana",
+        "2024-01-06,Laptop HP,Laptops,2,100.0,200.0,CLI-2,Lima Sur,Ana",
+        "2024-01-05,Laptop HP,Laptops,2,100.0,200.0,CLI-1,Lima Sur,Ana",
+    ])
+    df = extract(path)
+    seen = SeenKeys()
+    
+    first, _, _ = run_transformations(df.iloc[:2].copy(), seen)
+    second, _, stats = run_transformations(df.iloc[2:].copy(), seen)
+    
+    assert list(first['cliente_id']) == ['CLI-1', 'CLI-2']
+    assert len(second) == 0
+    assert stats['duplicates_removed'] == 1
+
+
+def test_run_transformations_rejects_unknown_engine(monkeypatch):
+    """Un motor desconocido falla en lugar de caer en pandas"""
+    monkeypatch.setattr(etl_config, 'transform_engine', 'spark')
+    
+    with pytest.raises(ValueError, match='spark'):
+        run_transformations(pd.DataFrame())
+
+
+def test_split_sql_script_handles_delimiter_blocks():
+    """Sentencias con ';' van en un bloque; las de DELIMITER, una por una"""
+    script = (
+        "-- Comentario inicial\n"
+        "CREATE TABLE IF NOT EXISTS a (id INT);\n"
+        "CREATE TABLE IF NOT EXISTS b (id INT);\n"
+        "\n"
+        "DELIMITER //\n"
+        "CREATE PROCEDURE p1()\n"
+        "BEGIN\n"
+        "    SELECT 1;\n"
+        "END //\n"
+        "CREATE PROCEDURE p2()\n"
+        "BEGIN\n"
+        "    SELECT 2;\n"
+        "END //\n"
+        "DELIMITER ;\n"
+        "\n"
+        "-- Solo comentarios\n"
+    )
+    
+    blocks = split_sql_script(script)
+    
+    assert blocks == [
+        "-- Comentario inicial\n"
+        "CREATE TABLE IF NOT EXISTS a (id INT);\n"
+        "CREATE TABLE IF NOT EXISTS b (id INT);",
+        "CREATE PROCEDURE p1()\nBEGIN\n    SELECT 1;\nEND",
+        "CREATE PROCEDURE p2()\nBEGIN\n    SELECT 2;\nEND",
+    ]
+
+
+def test_create_tables_script_is_idempotent():
+    """El DDL se ejecuta en cada corrida: sin DROP ni USE"""
+    with open(os.path.join(etl_config.sql_dir, 'create_tables.sql'), encoding='utf-8') as f:
+        blocks = split_sql_script(f.read())
+    
+    statements = [
+        line.strip().upper()
+        for block in blocks
+        for line in block.splitlines()
+        if line.strip() and not line.strip().startswith('--')
+    ]
+    
+    assert not any(s.startswith(('DROP TABLE', 'USE ')) for s in statements)
+    assert not any(
+        s.startswith('CREATE TABLE') and 'IF NOT EXISTS' not in s
+        for s in statements
+    )
+    assert [b.split('(')[0] for b in blocks if 'PROCEDURE' in b] == [
+        'DROP PROCEDURE IF EXISTS sp_limpiar_datos_antiguos',
+        'CREATE PROCEDURE sp_limpiar_datos_antiguos'
+    ]
+
+
+class RecordingConnection:
+    """Conexión falsa que registra las sentencias ejecutadas"""
+    
+    def __init__(self):
+        self.statements = []
+        self.cursor = self
+    
+    def execute(self, query, params=None):
+        self.statements.append(query)
+
+
+@pytest.mark.parametrize('disable_binlog', [False, True])
+def test_bulk_load_session_touches_binlog_only_when_enabled(monkeypatch, disable_binlog):
+    """sql_log_bin solo se modifica con disable_binlog explícito"""
+    monkeypatch.setattr(etl_config, 'disable_binlog', disable_binlog)
+    conn = RecordingConnection()
+    
+    with bulk_load_session(conn):
+        pass
+    
+    binlog_statements = [q for q in conn.statements if 'sql_log_bin' in q]
+    if disable_binlog:
+        assert binlog_statements == [
+            "SET SESSION sql_log_bin = 0",
+            "SET SESSION sql_log_bin = 1",
+        ]
+    else:
+        assert binlog_statements == []
+
+
+class FakeDatabase:
+    """Tabla ventas simulada: filas confirmadas compartidas entre conexiones"""
+    
+    def __init__(self):
+        self.ventas = []
+
+
+class FakeConnection(RecordingConnection):
+    """Conexión falsa del pool: INSERT transaccional y LOAD DATA rechazado"""
+    
+    def __init__(self, db):
+        super().__init__()
+        self.db = db
+        self.pending = []
+    
+    def execute(self, query, params=None):
+        super().execute(query, params)
+        if 'LOAD DATA' in query:
+            raise etl_pipeline.MySQLError("Loading local data is disabled")
+        if 'INSERT INTO ventas' in query:
+            columns = len(etl_pipeline.VENTAS_COLUMNS)
+            self.pending.extend(
+                params[i:i + columns] for i in range(0, len(params), columns)
+            )
+        elif 'TRUNCATE TABLE ventas' in query:
+            self.pending.clear()
+            self.db.ventas.clear()
+        return self
+    
+    def execute_multi(self, script):
+        return 0
+    
+    def commit(self):
+        self.db.ventas.extend(self.pending)
+        self.pending.clear()
+    
+    def rollback(self):
+        self.pending.clear()
+
+
+def test_stream_failure_leaves_ventas_empty(tmp_path, monkeypatch):
+    """Un fallo a mitad del stream descarta también las porciones de INSERT"""
+    db = FakeDatabase()
+    
+    @contextmanager
+    def fake_connection():
+        yield FakeConnection(db)
+    
+    transformations = []
+    
+    def failing_transformations(df, seen_keys=None):
+        transformations.append(len(df))
+        if len(transformations) == 3:
+            raise ValueError("fallo en el chunk 3")
+        return run_transformations(df, seen_keys)
+    
+    monkeypatch.setattr(etl_pipeline, 'get_mysql_connection', fake_connection)
+    monkeypatch.setattr(etl_pipeline, 'run_transformations', failing_transformations)
+    monkeypatch.setattr(etl_config, 'chunk_size', 2)
+    monkeypatch.setattr(etl_config, 'batch_size', 1)
+    path = write_csv(tmp_path, [
+        f"2024-01-0{day},Laptop HP,Laptops,2,100.0,200.0,CLI-{day},Lima Sur,Ana"
+        for day in range(1, 8)
+    ])
+    
+    with pytest.raises(ValueError, match='chunk 3'):
+        etl_pipeline.stream_etl(path, 'test')
+    
+    assert db.ventas == []
+
+
+@pytest.mark.parametrize('rows', [
+    ["06/01/2024,Laptop HP,Laptops,2,100.0,200.0,CLI-1,Lima Sur,Ana"],
+    [
+        "2024-03-15,Laptop HP,Laptops,2,100.0,200.0,CLI-0,Lima Sur,Ana",
+        "06/01/2024,Laptop HP,Laptops,2,100.0,200.0,CLI-1,Lima Sur,Ana",
+    ],
+])
+def test_day_first_dates_do_not_depend_on_other_rows(tmp_path, rows):
+    """dd/mm/yyyy se interpreta igual con o sin filas ISO en el archivo"""
+    df_clean, _, _ = transform(extract(write_csv(tmp_path, rows)))
+    
+    fecha = df_clean.set_index('cliente_id').loc['CLI-1', 'fecha']
+    assert str(fecha) == '2024-01-06'
+
+
+class MultiResultCursor:
+    """Cursor falso con la API multi-sentencia de Connector/Python 9.2+"""
+    
+    def __init__(self, results):
+        self.results = list(results)
+        self.with_rows = False
+        self.scripts = []
+    
+    def execute(self, script):
+        self.scripts.append(script)
+        self.with_rows = self.results.pop(0)
+    
+    def fetchall(self):
+        return []
+    
+    def nextset(self):
+        if not self.results:
+            return None
+        self.with_rows = self.results.pop(0)
+        return True
+
+
+def test_execute_multi_supports_connector_9_api(monkeypatch):
+    """execute_multi recorre los result sets con nextset() en 9.2+"""
+    monkeypatch.setattr(etl_pipeline, 'MYSQL_CONNECTOR_VERSION', (9, 2, 0))
+    conn = etl_pipeline.MySQLConnection(etl_pipeline.mysql_config)
+    conn.cursor = MultiResultCursor([False, False, True])
+    
+    executed = conn.execute_multi("CREATE TABLE a (id INT); SELECT 1;")
+    
+    assert executed == 3
+    assert conn.cursor.scripts == ["CREATE TABLE a (id INT); SELECT 1;"]
+
+
+@pytest.mark.parametrize('value, expected', [('true', True), ('0', False), (None, False)])
+def test_mysql_use_pure_is_read_from_environment(monkeypatch, value, expected):
+    """MYSQL_USE_PURE aplica a la configuración por defecto del pipeline"""
+    if value is None:
+        monkeypatch.delenv('MYSQL_USE_PURE', raising=False)
+    else:
+        monkeypatch.setenv('MYSQL_USE_PURE', value)
+    
+    assert MySQLConfig().use_pure is expected
+
+
+def test_insert_batches_with_single_connection_pool(tmp_path, monkeypatch):
+    """Con pool_size=1 se inserta en serie sobre la conexión principal"""
+    def exhausted_pool():
+        raise ConnectionError("No se pudo conectar a MySQL")
+    
+    monkeypatch.setattr(etl_pipeline, 'get_mysql_connection', exhausted_pool)
+    monkeypatch.setattr(mysql_config, 'pool_size', 1)
+    monkeypatch.setattr(etl_config, 'batch_size', 2)
+    path = write_csv(tmp_path, [
+        f"2024-01-0{day},Laptop HP,Laptops,2,100.0,200.0,CLI-{day},Lima Sur,Ana"
+        for day in range(1, 6)
+    ])
+    df_clean, _, _ = transform(extract(path))
+    db = FakeDatabase()
+    conn = FakeConnection(db)
+    
+    inserted = etl_pipeline.insert_batches(conn, df_clean)
+    
+    assert inserted == 5
+    assert len(conn.pending) == 5
+    assert db.ventas == []